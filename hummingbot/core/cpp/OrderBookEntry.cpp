@@ -30,18 +30,17 @@ bool operator<(OrderBookEntry const &a, OrderBookEntry const &b) {
 }
 
 void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook) {
-    std::set<OrderBookEntry>::reverse_iterator bidIterator = bidBook.rbegin();
-    std::set<OrderBookEntry>::iterator askIterator = askBook.begin();
-    while (bidIterator != bidBook.rend() && askIterator != askBook.end()) {
+    // Erasing invalidates the iterators into the touched book, so the top bid and ask are re-fetched every pass.
+    while (!bidBook.empty() && !askBook.empty()) {
+        std::set<OrderBookEntry>::reverse_iterator bidIterator = bidBook.rbegin();
+        std::set<OrderBookEntry>::iterator askIterator = askBook.begin();
         const OrderBookEntry& topBid = *bidIterator;
         const OrderBookEntry& topAsk = *askIterator;
         if (topBid.price >= topAsk.price) {
             if (topBid.updateId > topAsk.updateId) {
-                askBook.erase(askIterator++);
+                askBook.erase(askIterator);
             } else {
-                std::set<OrderBookEntry>::iterator eraseIterator = (std::next(bidIterator)).base();
-                bidIterator++;
-                bidBook.erase(eraseIterator);
+                bidBook.erase(std::next(bidIterator).base());
             }
         } else {
             break;
@@ -32,6 +32,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._snapshot = None
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,6 +76,8 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        # The composite entries have changed, so the cached snapshot data frames are out of date.
+        self._snapshot = None
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -16,10 +16,12 @@ cdef class OrderBook(PubSub):
     cdef int64_t _last_diff_uid
     cdef double _best_bid
     cdef double _best_ask
+    cdef object _snapshot
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_apply_trade_raw(self, str trading_pair, double timestamp, double price, double amount, double trade_type)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
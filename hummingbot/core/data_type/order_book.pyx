@@ -9,14 +9,17 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
-    OrderBookTradeEvent
+    OrderBookTradeEvent,
+    TradeType
 )
 from typing import (
     List,
+    Iterable,
     Iterator,
     Tuple,
     Optional,
-    Dict
+    Dict,
+    Union
 )
 from aiokafka import ConsumerRecord
 import pandas as pd
@@ -25,11 +28,71 @@ from .order_book_message import OrderBookMessage
 from .order_book_row import OrderBookRow
 from .order_book_query_result import OrderBookQueryResult
 from sqlalchemy.engine import RowProxy
-import bisect
 import logging
+cimport cython
 cimport numpy as np
 ob_logger = None
 NaN = float("nan")
+# Trade messages carry the trade type as a float of the TradeType value.
+cdef double SELL_TRADE_TYPE = float(TradeType.SELL.value)
+
+
+cdef vector[OrderBookEntry] c_rows_to_entries(object rows):
+    """
+    Converts an iterable of OrderBookRow into order book entries. The rows are unpacked straight into C typed values,
+    rather than going through the namedtuple attribute accessors for every field.
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+        double price
+        double amount
+        int64_t update_id
+    # Generators of rows can't be sized up front.
+    if hasattr(rows, "__len__"):
+        entries.reserve(len(rows))
+    for price, amount, update_id in rows:
+        entries.push_back(OrderBookEntry(price, amount, update_id))
+    return entries
+
+
+cdef np.ndarray c_to_numpy_rows(object rows):
+    """
+    Coerces [price, amount, update_id] rows - an array of any dtype or memory layout, or a list of rows - into the 2-D
+    float64 array that c_numpy_rows_to_entries() indexes without bounds checks.
+    """
+    cdef np.ndarray array = np.asarray(rows, dtype=np.float64)
+    # An empty list has no columns to check.
+    if array.size == 0:
+        return array.reshape((0, 3))
+    if array.ndim != 2 or array.shape[1] < 3:
+        raise ValueError(f"Order book rows must be a 2-D array with 3 columns, [price, amount, update_id]. "
+                         f"Got shape {np.shape(array)}.")
+    return array
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int64_t c_numpy_rows_to_entries(np.ndarray[np.float64_t, ndim=2] rows,
+                                     vector[OrderBookEntry] *entries,
+                                     int64_t last_update_id) except? -1:
+    """
+    Converts the [price, amount, update_id] rows of a float64 array into order book entries, with direct typed
+    indexing into the array buffer. Returns the largest of last_update_id and the rows' update IDs.
+    """
+    cdef:
+        Py_ssize_t i
+        Py_ssize_t num_rows = rows.shape[0]
+        int64_t update_id
+    # The loop below reads 3 columns of every row unchecked, so a narrower array must never get there.
+    if num_rows > 0 and rows.shape[1] < 3:
+        raise ValueError(f"Order book rows must have 3 columns, [price, amount, update_id]. Got {rows.shape[1]}.")
+    deref(entries).reserve(deref(entries).size() + num_rows)
+    for i in range(num_rows):
+        update_id = <int64_t>rows[i, 2]
+        deref(entries).push_back(OrderBookEntry(rows[i, 0], rows[i, 1], update_id))
+        if update_id > last_update_id:
+            last_update_id = update_id
+    return last_update_id
 
 
 cdef class OrderBook(PubSub):
@@ -47,6 +110,7 @@ cdef class OrderBook(PubSub):
         self._snapshot_uid = 0
         self._last_diff_uid = 0
         self._best_bid = self._best_ask = float("NaN")
+        self._snapshot = None
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -88,6 +152,9 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        # The cached snapshot data frames are now out of date.
+        self._snapshot = None
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -112,9 +179,24 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        # The cached snapshot data frames are now out of date.
+        self._snapshot = None
+
     cdef c_apply_trade(self, object trade_event):
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_apply_trade_raw(self, str trading_pair, double timestamp, double price, double amount, double trade_type):
+        # Only build the trade event object if anyone is listening to it.
+        if self._events.count(self.ORDER_BOOK_TRADE_EVENT_TAG) < 1:
+            return
+        self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, OrderBookTradeEvent(
+            trading_pair=trading_pair,
+            timestamp=timestamp,
+            type=TradeType.SELL if trade_type == SELL_TRADE_TYPE else TradeType.BUY,
+            price=price,
+            amount=amount
+        ))
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -125,35 +207,47 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
-        return bids_df, asks_df
+        """
+        The bid and ask entries of the order book, as data frames. The data frames are built once and cached until the
+        next update to the order book - each call returns copies of them, so callers are free to modify them.
+        """
+        if self._snapshot is None:
+            bids_rows = list(self.bid_entries())
+            asks_rows = list(self.ask_entries())
+            bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
+            asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+            self._snapshot = (bids_df, asks_df)
+        bids_df, asks_df = self._snapshot
+        return bids_df.copy(), asks_df.copy()
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
-        cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-        for row in bids:
-            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        for row in asks:
-            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+        self.c_apply_diffs(c_rows_to_entries(bids), c_rows_to_entries(asks), update_id)
+
+    def apply_diffs_batch(self,
+                          bids_batch: List[List[OrderBookRow]],
+                          asks_batch: List[List[OrderBookRow]],
+                          update_ids: List[int]):
+        """
+        Applies a batch of consecutive diffs, oldest first, in a single call. Each diff is still merged into the order
+        book separately, with its own update ID, so that the overlap truncation sees the same book states as a sequence
+        of apply_diffs() calls would.
+        """
+        for bids, asks, update_id in zip(bids_batch, asks_batch, update_ids):
+            self.c_apply_diffs(c_rows_to_entries(bids), c_rows_to_entries(asks), update_id)
 
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
-        cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-        for row in bids:
-            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        for row in asks:
-            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+        self.c_apply_snapshot(c_rows_to_entries(bids), c_rows_to_entries(asks), update_id)
 
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
+    def apply_trade_raw(self, trading_pair: str, timestamp: float, price: float, amount: float, trade_type: float):
+        """
+        Same as apply_trade(), but takes the trade fields directly, with trade_type being the float of the TradeType
+        value. The trade event is only created when there are trade event listeners.
+        """
+        self.c_apply_trade_raw(trading_pair, timestamp, price, amount, trade_type)
+
     def apply_pandas_diffs(self, bids_df: pd.DataFrame, asks_df: pd.DataFrame):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id], and a UNIX timestamp index.
@@ -162,12 +256,12 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: Union[np.ndarray, List], asks_array: Union[np.ndarray, List]):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        Arrays of other dtypes, and lists of rows, are converted to double first.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(c_to_numpy_rows(bids_array), c_to_numpy_rows(asks_array))
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
@@ -181,20 +275,16 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        last_update_id = c_numpy_rows_to_entries(bids_array, &cpp_bids, last_update_id)
+        last_update_id = c_numpy_rows_to_entries(asks_array, &cpp_asks, last_update_id)
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: Union[np.ndarray, List], asks_array: Union[np.ndarray, List]):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        Arrays of other dtypes, and lists of rows, are converted to double first.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(c_to_numpy_rows(bids_array), c_to_numpy_rows(asks_array))
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
@@ -208,12 +298,8 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        last_update_id = c_numpy_rows_to_entries(bids_array, &cpp_bids, last_update_id)
+        last_update_id = c_numpy_rows_to_entries(asks_array, &cpp_asks, last_update_id)
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -449,9 +535,13 @@ cdef class OrderBook(PubSub):
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         pass
 
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
-        replay_position = bisect.bisect_right(diffs, snapshot)
-        replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
-        for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
+        """
+        Restores the order book from a snapshot, and then replays the diffs newer than the snapshot. The diffs can be any
+        iterable in update ID order, e.g. the tracker's past diffs deque, and are iterated over once.
+        """
+        snapshot_update_id = snapshot.update_id
+        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot_update_id)
+        for diff in diffs:
+            if diff.update_id > snapshot_update_id:
+                self.apply_diffs(diff.bids, diff.asks, diff.update_id)
@@ -1,33 +1,33 @@
 #!/usr/bin/env python
 import asyncio
-from abc import abstractmethod, ABC
-from collections import deque
+from abc import abstractmethod, ABCMeta
+from collections import deque, defaultdict
 from enum import Enum
 import logging
 import pandas as pd
-import re
-import time
 from typing import (
+    Any,
     Dict,
     Set,
     Deque,
+    Iterable,
     Optional,
+    Sequence,
     Tuple,
     List)
 
-from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from .order_book_message import (
-    OrderBookMessageType,
-    OrderBookMessage,
+from hummingbot.core.utils.message_stream import (
+    MessageDispatcher,
+    MessageStream,
 )
+from .order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 
-TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
-
 
 class OrderBookTrackerDataSourceType(Enum):
     # LOCAL_CLUSTER = 1 deprecated
@@ -35,8 +35,35 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
-class OrderBookTracker(ABC):
+class OrderBookTracker(metaclass=ABCMeta):
+    # The instance attributes set up by the base tracker are kept in slots, for cheaper access from the router loops.
+    # Exchange specific trackers declare their own attributes in __slots__ as well, so that no instance dict is created.
+    # The base class uses ABCMeta rather than inheriting from ABC, which has no __slots__ of its own on python 3.6.
+    __slots__ = (
+        "_data_source_type",
+        "_order_books",
+        "_pair_states",
+        "_active_order_trackers",
+        "_saved_message_queues",
+        "_stopped_trading_pairs",
+        "_order_book_diff_stream",
+        "_order_book_snapshot_dispatcher",
+        "_order_book_trade_stream",
+        "_stats",
+        "_order_book_diff_listener_task",
+        "_order_book_trade_listener_task",
+        "_order_book_snapshot_listener_task",
+        "_order_book_diff_router_task",
+        "_emit_trade_event_task",
+        "_stats_log_task",
+        "_refresh_tracking_task",
+    )
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Number of diffs kept per trading pair while the pair isn't tracked yet, e.g. while its initial snapshot is
+    # fetched.
+    SAVED_MESSAGES_SIZE: int = 1000
+    STATS_LOG_INTERVAL: float = 60.0
+    DIFF_BATCH_SIZE: int = 256
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -48,21 +75,35 @@ class OrderBookTracker(ABC):
     def __init__(self,
                  data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API):
         self._data_source_type: OrderBookTrackerDataSourceType = data_source_type
-        self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
-        self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
-        self._past_diffs_windows: Dict[str, Deque] = {}
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
-        self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        # The order book and past diffs window of each tracked trading pair, so the routers fetch both in one lookup.
+        # The windows hold the latest PAST_DIFF_WINDOW_SIZE diff messages, which are converted again when replayed.
+        self._pair_states: Dict[str, Tuple[OrderBook, Deque[OrderBookMessage]]] = {}
+        # The active order trackers of the tracked trading pairs, for exchanges that convert their messages through one.
+        self._active_order_trackers: Dict[str, Any] = {}
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.SAVED_MESSAGES_SIZE)
+        )
+        # Trading pairs that were tracked before, whose diffs are rejected rather than saved.
+        self._stopped_trading_pairs: Set[str] = set()
+        self._order_book_diff_stream: MessageStream = MessageStream()
+        # Snapshots are rare, so the snapshot listeners hand them to handle_snapshot() directly.
+        self._order_book_snapshot_dispatcher: MessageDispatcher = MessageDispatcher(self.handle_snapshot)
+        self._order_book_trade_stream: MessageStream = MessageStream()
+        self._stats: Dict[str, int] = {
+            "diff_messages_accepted": 0,
+            "diff_messages_rejected": 0,
+            "diff_messages_queued": 0,
+            "trade_messages_accepted": 0,
+            "trade_messages_rejected": 0,
+        }
 
         self._order_book_diff_listener_task: Optional[asyncio.Task] = None
         self._order_book_trade_listener_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_listener_task: Optional[asyncio.Task] = None
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
-        self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._emit_trade_event_task: Optional[asyncio.Task] = None
+        self._stats_log_task: Optional[asyncio.Task] = None
         self._refresh_tracking_task: Optional[asyncio.Task] = None
 
     @property
@@ -99,11 +140,17 @@ class OrderBookTracker(ABC):
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        self._stats_log_task = safe_ensure_future(
+            self._stats_log_loop()
+        )
 
     def stop(self):
         if self._emit_trade_event_task is not None:
             self._emit_trade_event_task.cancel()
             self._emit_trade_event_task = None
+        if self._stats_log_task is not None:
+            self._stats_log_task.cancel()
+            self._stats_log_task = None
         if self._order_book_diff_listener_task is not None:
             self._order_book_diff_listener_task.cancel()
             self._order_book_diff_listener_task = None
@@ -116,34 +163,49 @@ class OrderBookTracker(ABC):
         if self._order_book_diff_router_task is not None:
             self._order_book_diff_router_task.cancel()
             self._order_book_diff_router_task = None
-        if self._order_book_snapshot_router_task is not None:
-            self._order_book_snapshot_router_task.cancel()
-            self._order_book_snapshot_router_task = None
 
     async def _refresh_tracking_tasks(self):
         """
         Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
         """
-        tracking_trading_pairs: Set[str] = set([key for key in self._tracking_tasks.keys()
-                                          if not self._tracking_tasks[key].done()])
+        tracking_trading_pairs: Set[str] = set(self._pair_states.keys())
         available_pairs: Dict[str, OrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
         available_trading_pairs: Set[str] = set(available_pairs.keys())
         new_trading_pairs: Set[str] = available_trading_pairs - tracking_trading_pairs
         deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
 
         for trading_pair in new_trading_pairs:
-            self._order_books[trading_pair] = available_pairs[trading_pair].order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            self._start_tracking(trading_pair, available_pairs[trading_pair])
             self.logger().info("Started order book tracking for %s.", trading_pair)
 
         for trading_pair in deleted_trading_pairs:
-            self._tracking_tasks[trading_pair].cancel()
-            del self._tracking_tasks[trading_pair]
-            del self._order_books[trading_pair]
-            del self._tracking_message_queues[trading_pair]
+            self._stop_tracking(trading_pair)
             self.logger().info("Stopped order book tracking for %s.", trading_pair)
 
+    def _start_tracking(self, trading_pair: str, order_book_tracker_entry: OrderBookTrackerEntry):
+        """
+        Sets up the order book, active order tracker and past diffs window of a new trading pair, and routes the diffs
+        received while its initial snapshot was being fetched.
+        """
+        order_book: OrderBook = order_book_tracker_entry.order_book
+        past_diffs_window: Deque[OrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
+        active_order_tracker: Any = order_book_tracker_entry.active_order_tracker
+        if active_order_tracker is not None:
+            self._active_order_trackers[trading_pair] = active_order_tracker
+        self._order_books[trading_pair] = order_book
+        self._pair_states[trading_pair] = (order_book, past_diffs_window)
+        self._stopped_trading_pairs.discard(trading_pair)
+        saved_messages: Optional[Deque[OrderBookMessage]] = self._saved_message_queues.pop(trading_pair, None)
+        if saved_messages is not None:
+            self._route_pair_diffs(trading_pair, saved_messages)
+
+    def _stop_tracking(self, trading_pair: str):
+        del self._pair_states[trading_pair]
+        del self._order_books[trading_pair]
+        self._active_order_trackers.pop(trading_pair, None)
+        self._saved_message_queues.pop(trading_pair, None)
+        self._stopped_trading_pairs.add(trading_pair)
+
     async def _refresh_tracking_loop(self):
         """
         Refreshes the tracking of new markets, removes inactive markets, every once in a while.
@@ -160,141 +222,248 @@ class OrderBookTracker(ABC):
 
     async def _order_book_diff_router(self):
         """
-        Route the real-time order book diff messages to the correct order book.
-        """
-        last_message_timestamp: float = time.time()
-        messages_accepted: int = 0
-        messages_rejected: int = 0
+        Apply the real-time order book diff messages to the correct order book.
 
+        The pending diffs are drained in batches of up to DIFF_BATCH_SIZE messages and grouped by trading pair, such
+        that each order book only needs to be looked up and merged into once per batch.
+        """
         while True:
             try:
-                ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().info("Diff messages processed: %d, rejected: %d",
-                                       messages_accepted,
-                                       messages_rejected)
-                    messages_accepted = 0
-                    messages_rejected = 0
-
-                last_message_timestamp = now
+                stats: Dict[str, int] = self._stats
+                diff_stream: MessageStream = self._order_book_diff_stream
+                # Bind the attributes used per message to locals, to skip the attribute lookups in the loop below.
+                # Only the asyncio.Queue interface of the stream is used, so exchange trackers may replace the stream
+                # with a queue.
+                next_message = diff_stream.get_nowait
+                stream_empty = diff_stream.empty
+                route_pair_diffs = self._route_pair_diffs
+                batch_size: int = self.DIFF_BATCH_SIZE
+
+                batch_messages: List[OrderBookMessage] = [await diff_stream.get()]
+                while True:
+                    while len(batch_messages) < batch_size and not stream_empty():
+                        batch_messages.append(next_message())
+                    batch: Dict[str, List[OrderBookMessage]] = {}
+                    for ob_message in batch_messages:
+                        # The batch is already off the stream, so a malformed message must not drop the whole batch.
+                        try:
+                            trading_pair: str = ob_message.trading_pair
+                        except Exception:
+                            stats["diff_messages_rejected"] += 1
+                            self.logger().error("Unexpected order book diff message %r.", ob_message, exc_info=True)
+                            continue
+                        pair_messages: Optional[List[OrderBookMessage]] = batch.get(trading_pair)
+                        if pair_messages is None:
+                            batch[trading_pair] = [ob_message]
+                        else:
+                            pair_messages.append(ob_message)
+
+                    for trading_pair, pair_messages in batch.items():
+                        route_pair_diffs(trading_pair, pair_messages)
+
+                    if stream_empty():
+                        break
+                    batch_messages = [next_message()]
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
-    async def _order_book_snapshot_router(self):
+    def _route_pair_diffs(self, trading_pair: str, diff_messages: Sequence[OrderBookMessage]) -> int:
         """
-        Route the real-time order book snapshot messages to the correct order book.
+        Applies the diff messages of a single trading pair, and counts them in the tracker stats. The diffs of a
+        trading pair that isn't tracked yet are saved, and applied once tracking starts. The diffs of a trading pair
+        that is no longer tracked are rejected.
+
+        Errors applying the diffs are logged rather than raised, so that they don't hold up the other pairs' diffs.
+
+        :return: The number of diffs applied
         """
-        while True:
-            try:
-                ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
-                trading_pair: str = ob_message.trading_pair
-                if trading_pair not in self._tracking_message_queues:
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                await message_queue.put(ob_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
-                await asyncio.sleep(5.0)
+        stats: Dict[str, int] = self._stats
+        pair_state: Optional[Tuple[OrderBook, Deque]] = self._pair_states.get(trading_pair)
+        if pair_state is None:
+            if trading_pair in self._stopped_trading_pairs:
+                stats["diff_messages_rejected"] += len(diff_messages)
+            else:
+                self._saved_message_queues[trading_pair].extend(diff_messages)
+                stats["diff_messages_queued"] += len(diff_messages)
+            return 0
+        order_book, past_diffs_window = pair_state
+        try:
+            diffs_applied: int = self._apply_pair_diffs(trading_pair, order_book, past_diffs_window, diff_messages)
+        except Exception:
+            stats["diff_messages_rejected"] += len(diff_messages)
+            self.logger().error("Unexpected error applying order book diffs for %s.", trading_pair, exc_info=True)
+            return 0
+        stats["diff_messages_accepted"] += diffs_applied
+        stats["diff_messages_rejected"] += len(diff_messages) - diffs_applied
+        return diffs_applied
+
+    def _convert_diff_message(self,
+                              trading_pair: str,
+                              ob_message: OrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Converts a diff message into the bid and ask rows to apply to the trading pair's order book.
 
-    async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
+        Exchange trackers that convert their messages through an active order tracker override this, together with
+        _convert_snapshot_message().
+        """
+        return ob_message.bids, ob_message.asks
+
+    def _convert_snapshot_message(self,
+                                  trading_pair: str,
+                                  ob_message: OrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Converts a snapshot message into the bid and ask rows to restore the trading pair's order book from.
+        """
+        return ob_message.bids, ob_message.asks
+
+    def _apply_pair_diffs(self,
+                          trading_pair: str,
+                          order_book: OrderBook,
+                          past_diffs_window: Deque[OrderBookMessage],
+                          diff_messages: Iterable[OrderBookMessage]) -> int:
+        """
+        Applies the diff messages of a single trading pair to its order book in one call, and remembers them in the
+        pair's past diffs window once they're applied. Diffs older than the order book's snapshot are skipped.
 
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: OrderBook = self._order_books[trading_pair]
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
+        Exchange trackers whose diff messages hold the entire order book override this.
 
+        :return: The number of diffs applied
+        """
+        convert_diff_message = self._convert_diff_message
+        snapshot_uid: int = order_book.snapshot_uid
+        bids_batch: List[List[OrderBookRow]] = []
+        asks_batch: List[List[OrderBookRow]] = []
+        update_ids: List[int] = []
+        applied_messages: List[OrderBookMessage] = []
+
+        for ob_message in diff_messages:
+            # Check the order book's initial update ID. If it's larger, don't bother.
+            update_id: int = ob_message.update_id
+            if snapshot_uid > update_id:
+                continue
+            bids, asks = convert_diff_message(trading_pair, ob_message)
+            bids_batch.append(bids)
+            asks_batch.append(asks)
+            update_ids.append(update_id)
+            applied_messages.append(ob_message)
+
+        order_book.apply_diffs_batch(bids_batch, asks_batch, update_ids)
+        # Only diffs that made it into the order book may be replayed on the next snapshot.
+        past_diffs_window.extend(applied_messages)
+        return len(update_ids)
+
+    def _apply_snapshot(self,
+                        trading_pair: str,
+                        order_book: OrderBook,
+                        past_diffs_window: Deque[OrderBookMessage],
+                        snapshot_message: OrderBookMessage):
+        """
+        Restores a trading pair's order book from a snapshot message, then replays the past diffs that are newer than
+        the snapshot.
+        """
+        convert_diff_message = self._convert_diff_message
+        snapshot_update_id: int = snapshot_message.update_id
+        # The snapshot is converted first, so that active order trackers replay the diffs on top of the snapshot state.
+        s_bids, s_asks = self._convert_snapshot_message(trading_pair, snapshot_message)
+        order_book.apply_snapshot(s_bids, s_asks, snapshot_update_id)
+        for ob_message in past_diffs_window:
+            update_id: int = ob_message.update_id
+            if update_id > snapshot_update_id:
+                d_bids, d_asks = convert_diff_message(trading_pair, ob_message)
+                order_book.apply_diffs(d_bids, d_asks, update_id)
+
+    def handle_snapshot(self, ob_message: OrderBookMessage):
+        """
+        Applies a real-time order book snapshot message to the correct order book, replaying any newer diffs.
+
+        This is called directly by the snapshot listeners, through the tracker's snapshot dispatcher - so it runs in the
+        listener's task, and must not let any error escape into it.
+        """
+        try:
+            trading_pair: str = ob_message.trading_pair
+            pair_state: Optional[Tuple[OrderBook, Deque]] = self._pair_states.get(trading_pair)
+            if pair_state is None:
+                self.logger().debug("Ignoring order book snapshot for untracked trading pair %s.", trading_pair)
+                return
+            order_book, past_diffs_window = pair_state
+            self._apply_snapshot(trading_pair, order_book, past_diffs_window, ob_message)
+            self.logger().debug("Processed order book snapshot for %s.", trading_pair)
+        except Exception:
+            self.logger().error("Unexpected error processing order book snapshot %r.", ob_message, exc_info=True)
+
+    async def _emit_trade_event_loop(self):
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
+                stats: Dict[str, int] = self._stats
+                trade_stream: MessageStream = self._order_book_trade_stream
+                # Only the asyncio.Queue interface of the stream is used, so exchange trackers may replace it with a
+                # queue.
+                next_message = trade_stream.get_nowait
+                stream_empty = trade_stream.empty
+                order_books: Dict[str, OrderBook] = self._order_books
+
+                # Wait for the first message of a burst, then drain the rest of the burst without awaiting.
+                trade_messages: List[OrderBookMessage] = [await trade_stream.get()]
+                while not stream_empty():
+                    trade_messages.append(next_message())
+                for trade_message in trade_messages:
+                    # The burst is already off the stream, so a malformed message must not drop the rest of it.
+                    try:
+                        trading_pair: str = trade_message.trading_pair
+                        order_book: Optional[OrderBook] = order_books.get(trading_pair)
+
+                        if order_book is None:
+                            stats["trade_messages_rejected"] += 1
+                            continue
+
+                        content: Dict[str, Any] = trade_message.content
+                        order_book.apply_trade_raw(
+                            trading_pair,
+                            trade_message.timestamp,
+                            float(content["price"]),
+                            float(content["amount"]),
+                            content["trade_type"]
+                        )
+
+                        stats["trade_messages_accepted"] += 1
+                    except Exception:
+                        stats["trade_messages_rejected"] += 1
+                        self.logger().error("Unexpected order book trade message %r.", trade_message, exc_info=True)
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
+                self.logger().network(
+                    f"Unexpected error routing order book messages.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error routing order book messages. Retrying after 5 seconds."
+                )
                 await asyncio.sleep(5.0)
 
-    async def _emit_trade_event_loop(self):
-        last_message_timestamp: float = time.time()
-        messages_accepted: int = 0
-        messages_rejected: int = 0
+    async def _stats_log_loop(self):
+        """
+        Logs and resets the message statistics collected by the router loops, once every STATS_LOG_INTERVAL.
+        """
         while True:
             try:
-                trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
-                trading_pair: str = trade_message.trading_pair
-
-                if trading_pair not in self._order_books:
-                    messages_rejected += 1
-                    continue
-
-                order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.SELL
-                ))
-
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                stats: Dict[str, int] = self._stats
+                await asyncio.sleep(self.STATS_LOG_INTERVAL)
+                if (stats["diff_messages_accepted"] > 0 or stats["diff_messages_rejected"] > 0 or
+                        stats["diff_messages_queued"] > 0):
+                    self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
+                                        stats["diff_messages_accepted"],
+                                        stats["diff_messages_rejected"],
+                                        stats["diff_messages_queued"])
+                if stats["trade_messages_accepted"] > 0 or stats["trade_messages_rejected"] > 0:
                     self.logger().debug("Trade messages processed: %d, rejected: %d",
-                                        messages_accepted,
-                                        messages_rejected)
-                    messages_accepted = 0
-                    messages_rejected = 0
-
-                last_message_timestamp = now
+                                        stats["trade_messages_accepted"],
+                                        stats["trade_messages_rejected"])
+                for key in stats:
+                    stats[key] = 0
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().network(
-                    f"Unexpected error routing order book messages.",
-                    exc_info=True,
-                    app_warning_msg=f"Unexpected error routing order book messages. Retrying after 5 seconds."
-                )
+                self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
@@ -26,3 +26,10 @@ class OrderBookTrackerEntry:
     @property
     def order_book(self) -> OrderBook:
         return self._order_book
+
+    @property
+    def active_order_tracker(self):
+        """
+        The active order tracker of exchanges that convert their order book messages through one, None otherwise.
+        """
+        return None
@@ -10,7 +10,6 @@ from typing import (
     List,
     Optional,
 )
-import re
 import time
 import ujson
 import websockets
@@ -37,8 +36,6 @@ from hummingbot.market.bamboo_relay.bamboo_relay_constants import (
     BAMBOO_RELAY_TEST_WS
 )
 
-TRADING_PAIR_FILTER = re.compile(r"(WETH|DAI|CUSD|USDC|TUSD)$")
-
 
 class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
@@ -3,7 +3,7 @@ import ujson
 import logging
 from typing import (
     Dict,
-    List,
+    Iterable,
     Optional
 )
 
@@ -65,5 +65,5 @@ cdef class BambooRelayOrderBook(OrderBook):
         raise NotImplementedError("BambooRelay order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("BambooRelay order book needs to retain individual order data.")
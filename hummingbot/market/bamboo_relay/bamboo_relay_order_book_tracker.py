@@ -1,15 +1,13 @@
 #!/usr/bin/env python
 
 import asyncio
-from collections import deque, defaultdict
 import logging
-import time
 from typing import (
     Deque,
     Dict,
+    Iterable,
     List,
-    Optional,
-    Set
+    Optional
 )
 from hummingbot.core.event.events import TradeType
 from hummingbot.logger import HummingbotLogger
@@ -25,7 +23,6 @@ from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.market.bamboo_relay.bamboo_relay_order_book_tracker_entry import BambooRelayOrderBookTrackerEntry
 from hummingbot.market.bamboo_relay.bamboo_relay_order_book import BambooRelayOrderBook
 from hummingbot.market.bamboo_relay.bamboo_relay_active_order_tracker import BambooRelayActiveOrderTracker
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
@@ -36,6 +33,15 @@ from hummingbot.market.bamboo_relay.bamboo_relay_constants import (
 
 
 class BambooRelayOrderBookTracker(OrderBookTracker):
+    __slots__ = (
+        "_ev_loop",
+        "_data_source",
+        "_trading_pairs",
+        "_chain",
+        "_api_endpoint",
+        "_api_prefix",
+        "_network_id",
+    )
     _brobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -52,12 +58,7 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
 
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[OrderBookTrackerDataSource] = None
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._past_diffs_windows: Dict[str, Deque] = {}
         self._order_books: Dict[str, BambooRelayOrderBook] = {}
-        self._saved_message_queues: Dict[str, Deque[BambooRelayOrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
-        self._active_order_trackers: Dict[str, BambooRelayActiveOrderTracker] = defaultdict(BambooRelayActiveOrderTracker)
         self._trading_pairs: Optional[List[str]] = trading_pairs
         self._chain = chain
         if chain is EthereumChain.ROPSTEN:
@@ -105,7 +106,7 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
             self.data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_dispatcher)
         )
         self._refresh_tracking_task = safe_ensure_future(
             self._refresh_tracking_loop()
@@ -113,45 +114,11 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
         self._order_book_diff_router_task = safe_ensure_future(
             self._order_book_diff_router()
         )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
-
-    async def _refresh_tracking_tasks(self):
-        """
-        Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
-        """
-        tracking_trading_pairs: Set[str] = set([key for key in self._tracking_tasks.keys()
-                                               if not self._tracking_tasks[key].done()])
-        available_pairs: Dict[str, BambooRelayOrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
-        available_trading_pairs: Set[str] = set(available_pairs.keys())
-        new_trading_pairs: Set[str] = available_trading_pairs - tracking_trading_pairs
-        deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
-
-        for trading_pair in new_trading_pairs:
-            order_book_tracker_entry: BambooRelayOrderBookTrackerEntry = available_pairs[trading_pair]
-            self._active_order_trackers[trading_pair] = order_book_tracker_entry.active_order_tracker
-            self._order_books[trading_pair] = order_book_tracker_entry.order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info("Started order book tracking for %s.", trading_pair)
-
-        for trading_pair in deleted_trading_pairs:
-            self._tracking_tasks[trading_pair].cancel()
-            del self._tracking_tasks[trading_pair]
-            del self._order_books[trading_pair]
-            del self._active_order_trackers[trading_pair]
-            del self._tracking_message_queues[trading_pair]
-            self.logger().info("Stopped order book tracking for %s.", trading_pair)
 
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
         address_token_map: Dict[str, any] = await self._data_source.get_all_token_info(self._api_endpoint, self._api_prefix)
         while True:
             try:
@@ -162,19 +129,8 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                 quote_token_asset: str = address_token_map[quote_token_address]["symbol"]
                 trading_pair: str = f"{base_token_asset}-{quote_token_asset}"
 
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: BambooRelayOrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
+                if self._route_pair_diffs(trading_pair, (ob_message,)) == 0:
                     continue
-                await message_queue.put(ob_message)
 
                 for action in ob_message.content["actions"]:
                     if action["action"] == "FILL":  # put FILL messages to trade queue
@@ -188,21 +144,6 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                             "price": action["event"]["order"]["price"],
                             "amount": action["event"]["filledBaseTokenAmount"]
                         }, timestamp=ob_message.timestamp))
-
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
-                                        messages_accepted,
-                                        messages_rejected,
-                                        messages_queued)
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -213,39 +154,30 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                 )
                 await asyncio.sleep(5.0)
 
-    async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[BambooRelayOrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
+    def _convert_diff_message(self, trading_pair: str, ob_message: BambooRelayOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_diff_message_to_order_book_row(ob_message)
 
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: BambooRelayOrderBook = self._order_books[trading_pair]
-        active_order_tracker: BambooRelayActiveOrderTracker = self._active_order_trackers[trading_pair]
+    def _convert_snapshot_message(self, trading_pair: str, ob_message: BambooRelayOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_snapshot_message_to_order_book_row(ob_message)
 
-        while True:
-            try:
-                message: BambooRelayOrderBookMessage = None
-                saved_messages: Deque[BambooRelayOrderBookMessage] = self._saved_message_queues[trading_pair]
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    # Diff message just refreshes the entire snapshot
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_snapshot(bids, asks, message.update_id)
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
-
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error tracking order book for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg=f"Unexpected error tracking order book. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
+    def _apply_pair_diffs(self,
+                          trading_pair: str,
+                          order_book: BambooRelayOrderBook,
+                          past_diffs_window: Deque,
+                          diff_messages: Iterable[BambooRelayOrderBookMessage]) -> int:
+        """
+        The Bamboo Relay active order tracker folds each diff message into its own copy of the order book, and
+        converts it into the entire order book state - so each diff is applied as a snapshot of that state. They're
+        kept out of the past diffs window, as the active order tracker already holds their effect.
+        """
+        snapshot_uid: int = order_book.snapshot_uid
+        diffs_applied: int = 0
+        for message in diff_messages:
+            # Check the order book's initial update ID. If it's larger, don't bother.
+            if snapshot_uid > message.update_id:
+                continue
+            # Diff message just refreshes the entire snapshot
+            bids, asks = self._convert_diff_message(trading_pair, message)
+            order_book.apply_snapshot(bids, asks, message.update_id)
+            diffs_applied += 1
+        return diffs_applied
@@ -11,7 +11,6 @@ from typing import (
     List,
     Optional
 )
-import re
 import time
 import ujson
 import websockets
@@ -26,7 +25,6 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.binance.binance_order_book import BinanceOrderBook
 
-TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 SNAPSHOT_REST_URL = "https://api.binance.com/api/v1/depth"
 DIFF_STREAM_URL = "wss://stream.binance.com:9443/ws"
@@ -8,7 +8,7 @@ from typing import (
     Any,
     Optional,
     Dict,
-    List,
+    Iterable,
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import TradeType
@@ -144,5 +144,5 @@ cdef class BitcoinComOrderBook(OrderBook):
         raise NotImplementedError(constants.EXCHANGE_NAME + " order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError(constants.EXCHANGE_NAME + " order book needs to retain individual order data.")
@@ -1,33 +1,30 @@
 #!/usr/bin/env python
 import asyncio
-import bisect
 import logging
 import hummingbot.market.bitcoin_com.bitcoin_com_constants as constants
-import time
-
-from collections import (
-    defaultdict,
-    deque,
-)
 from typing import (
-    Deque,
     Dict,
     List,
     Optional,
 )
 from hummingbot.market.bitcoin_com.bitcoin_com_order_book_message import BitcoinComOrderBookMessage
-from hummingbot.core.data_type.order_book_message import OrderBookMessageType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, OrderBookTrackerDataSourceType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 # from hummingbot.market.bitcoin_com.bitcoin_com_order_book_tracker_entry import BitcoinComOrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.market.bitcoin_com.bitcoin_com_active_order_tracker import BitcoinComActiveOrderTracker
 from hummingbot.market.bitcoin_com.bitcoin_com_api_order_book_data_source import BitcoinComAPIOrderBookDataSource
 from hummingbot.market.bitcoin_com.bitcoin_com_order_book import BitcoinComOrderBook
 
 
 class BitcoinComOrderBookTracker(OrderBookTracker):
+    __slots__ = (
+        "_ev_loop",
+        "_data_source",
+        "_process_msg_deque_task",
+        "_trading_pairs",
+        "_order_book_stream_listener_task",
+    )
     _logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -45,14 +42,8 @@ class BitcoinComOrderBookTracker(OrderBookTracker):
 
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[OrderBookTrackerDataSource] = None
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._process_msg_deque_task: Optional[asyncio.Task] = None
-        self._past_diffs_windows: Dict[str, Deque] = {}
         self._order_books: Dict[str, BitcoinComOrderBook] = {}
-        self._saved_message_queues: Dict[str, Deque[BitcoinComOrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
-        self._active_order_trackers: Dict[str, BitcoinComActiveOrderTracker] = defaultdict(BitcoinComActiveOrderTracker)
         self._trading_pairs: Optional[List[str]] = trading_pairs
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
         self._order_book_trade_listener_task: Optional[asyncio.Task] = None
@@ -90,7 +81,7 @@ class BitcoinComOrderBookTracker(OrderBookTracker):
             self.data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_dispatcher)
         )
 
         self._refresh_tracking_task = safe_ensure_future(
@@ -99,67 +90,9 @@ class BitcoinComOrderBookTracker(OrderBookTracker):
         self._order_book_diff_router_task = safe_ensure_future(
             self._order_book_diff_router()
         )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
-
-    async def _track_single_book(self, trading_pair: str):
-        """
-        Update an order book with changes from the latest batch of received messages
-        """
-        past_diffs_window: Deque[BitcoinComOrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
-
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: BitcoinComOrderBook = self._order_books[trading_pair]
-        active_order_tracker: BitcoinComActiveOrderTracker = self._active_order_trackers[trading_pair]
-
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
-
-        while True:
-            try:
-                message: BitcoinComOrderBookMessage = None
-                saved_messages: Deque[BitcoinComOrderBookMessage] = self._saved_message_queues[trading_pair]
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
 
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[BitcoinComOrderBookMessage] = list(past_diffs_window)
-                    # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
-                    replay_position = bisect.bisect_right(past_diffs, message)
-                    replay_diffs = past_diffs[replay_position:]
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
-                    for diff_message in replay_diffs:
-                        d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(diff_message)
-                        order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
+    def _convert_diff_message(self, trading_pair: str, ob_message: BitcoinComOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_diff_message_to_order_book_row(ob_message)
 
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error processing order book messages for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg=f"Unexpected error processing order book messages. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
+    def _convert_snapshot_message(self, trading_pair: str, ob_message: BitcoinComOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_snapshot_message_to_order_book_row(ob_message)
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Optional
 
 import pandas as pd
 from sqlalchemy.engine import RowProxy
@@ -105,5 +105,5 @@ cdef class BitfinexOrderBook(OrderBook):
         raise NotImplementedError("Bitfinex order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("Bitfinex order book needs to retain individual order data.")
@@ -4,7 +4,7 @@ import logging
 from typing import (
     Any,
     Dict,
-    List,
+    Iterable,
     Optional,
 )
 
@@ -66,5 +66,5 @@ cdef class BittrexOrderBook(OrderBook):
         raise NotImplementedError("Bittrex order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("Bittrex order book needs to retain individual order data.")
@@ -3,7 +3,7 @@ import ujson
 import logging
 from typing import (
     Dict,
-    List,
+    Iterable,
     Optional,
 )
 
@@ -118,5 +118,5 @@ cdef class CoinbaseProOrderBook(OrderBook):
         raise NotImplementedError("Coinbase Pro order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("Coinbase Pro order book needs to retain individual order data.")
@@ -10,7 +10,6 @@ from typing import (
     List,
     Optional
 )
-import re
 import time
 import ujson
 import websockets
@@ -27,7 +26,6 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 
-TRADING_PAIR_FILTER = re.compile(r"(TUSD|WETH|DAI|SAI)$")
 
 REST_URL = "https://api.ddex.io/v3"
 WS_URL = "wss://ws.ddex.io/v3"
@@ -5,7 +5,7 @@ import logging
 from sqlalchemy.engine import RowProxy
 from typing import (
     Dict,
-    List,
+    Iterable,
     Optional,
 )
 import ujson
@@ -94,5 +94,5 @@ cdef class DDEXOrderBook(OrderBook):
         raise NotImplementedError("DDEX order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("DDEX order book needs to retain individual order data.")
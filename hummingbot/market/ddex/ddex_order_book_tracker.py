@@ -1,18 +1,12 @@
 #!/usr/bin/env python
 
 import asyncio
-import bisect
 import logging
-import time
-from collections import deque, defaultdict
 from typing import (
     Optional,
-    Deque,
     List,
     Dict,
-    Set,
 )
-from hummingbot.market.ddex.ddex_active_order_tracker import DDEXActiveOrderTracker
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import (
     OrderBookTracker,
@@ -24,11 +18,15 @@ from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAP
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.market.ddex.ddex_api_order_book_data_source import DDEXAPIOrderBookDataSource
 from hummingbot.market.ddex.ddex_order_book_message import DDEXOrderBookMessage
-from hummingbot.market.ddex.ddex_order_book_tracker_entry import DDEXOrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessageType
 
 
 class DDEXOrderBookTracker(OrderBookTracker):
+    __slots__ = (
+        "_ev_loop",
+        "_data_source",
+        "_trading_pairs",
+    )
     _dobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -41,14 +39,9 @@ class DDEXOrderBookTracker(OrderBookTracker):
                  data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API,
                  trading_pairs: Optional[List[str]] = None):
         super().__init__(data_source_type=data_source_type)
-        self._past_diffs_windows: Dict[str, Deque] = {}
         self._order_books: Dict[str, DDEXOrderBook] = {}
-        self._saved_message_queues: Dict[str, Deque[DDEXOrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[OrderBookTrackerDataSource] = None
-        self._active_order_trackers: Dict[str, DDEXActiveOrderTracker] = defaultdict(DDEXActiveOrderTracker)
         self._trading_pairs: Optional[List[str]] = trading_pairs
 
     @property
@@ -75,10 +68,7 @@ class DDEXOrderBookTracker(OrderBookTracker):
             self.data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
-        )
-        self._emit_trade_event_task = safe_ensure_future(
-            self._emit_trade_event_loop()
+            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_dispatcher)
         )
         self._refresh_tracking_task = safe_ensure_future(
             self._refresh_tracking_loop()
@@ -86,83 +76,21 @@ class DDEXOrderBookTracker(OrderBookTracker):
         self._order_book_diff_router_task = safe_ensure_future(
             self._order_book_diff_router()
         )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
-
-    async def _refresh_tracking_tasks(self):
-        """
-        Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
-        """
-        tracking_trading_pairs: Set[str] = set([key for key in self._tracking_tasks.keys()
-                                               if not self._tracking_tasks[key].done()])
-        available_pairs: Dict[str, DDEXOrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
-        available_trading_pairs: Set[str] = set(available_pairs.keys())
-        new_trading_pairs: Set[str] = available_trading_pairs - tracking_trading_pairs
-        deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
-
-        for trading_pair in new_trading_pairs:
-            order_book_tracker_entry: DDEXOrderBookTrackerEntry = available_pairs[trading_pair]
-            self._active_order_trackers[trading_pair] = order_book_tracker_entry.active_order_tracker
-            self._order_books[trading_pair] = order_book_tracker_entry.order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info("Started order book tracking for %s.", trading_pair)
-
-        for trading_pair in deleted_trading_pairs:
-            self._tracking_tasks[trading_pair].cancel()
-            del self._tracking_tasks[trading_pair]
-            del self._order_books[trading_pair]
-            del self._active_order_trackers[trading_pair]
-            del self._tracking_message_queues[trading_pair]
-            self.logger().info("Stopped order book tracking for %s.", trading_pair)
 
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
         while True:
             try:
                 ob_message: DDEXOrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: DDEXOrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-
-                if ob_message.type == OrderBookMessageType.DIFF:
-                    await message_queue.put(ob_message)
-                elif ob_message.type == OrderBookMessageType.TRADE:
+                # Trades come in on the same web socket as the diffs, and must not be saved or applied as diffs.
+                if ob_message.type == OrderBookMessageType.TRADE:
                     self._order_book_trade_stream.put_nowait(ob_message)
-
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
-                                        messages_accepted,
-                                        messages_rejected,
-                                        messages_queued)
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
+                elif ob_message.type == OrderBookMessageType.DIFF:
+                    self._route_pair_diffs(trading_pair, (ob_message,))
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -173,60 +101,8 @@ class DDEXOrderBookTracker(OrderBookTracker):
                 )
                 await asyncio.sleep(5.0)
 
-    async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[DDEXOrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
-
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: DDEXOrderBook = self._order_books[trading_pair]
-        active_order_tracker: DDEXActiveOrderTracker = self._active_order_trackers[trading_pair]
+    def _convert_diff_message(self, trading_pair: str, ob_message: DDEXOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_diff_message_to_order_book_row(ob_message)
 
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
-
-        while True:
-            try:
-                message: DDEXOrderBookMessage = None
-                saved_messages: Deque[DDEXOrderBookMessage] = self._saved_message_queues[trading_pair]
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[DDEXOrderBookMessage] = list(past_diffs_window)
-                    # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
-                    replay_position = bisect.bisect_right(past_diffs, message)
-                    replay_diffs = past_diffs[replay_position:]
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
-                    for diff_message in replay_diffs:
-                        d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(diff_message)
-                        order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
-
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error tracking order book for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg=f"Unexpected error tracking order book. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
+    def _convert_snapshot_message(self, trading_pair: str, ob_message: DDEXOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_snapshot_message_to_order_book_row(ob_message)
@@ -5,7 +5,7 @@ import logging
 from sqlalchemy.engine import RowProxy
 from typing import (
     Dict,
-    List,
+    Iterable,
     Optional,
 )
 import ujson
@@ -75,5 +75,5 @@ cdef class DolomiteOrderBook(OrderBook):
         raise NotImplementedError("Dolomite order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("Dolomite order book needs to retain individual order data.")
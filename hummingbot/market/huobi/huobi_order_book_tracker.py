@@ -2,17 +2,15 @@
 
 import asyncio
 import logging
-import time
 from typing import (
+    Deque,
+    Iterable,
     List,
     Optional
 )
 
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import (
-    OrderBookMessage,
-    OrderBookMessageType
-)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker import (
     OrderBookTracker,
     OrderBookTrackerDataSourceType
@@ -24,6 +22,11 @@ from hummingbot.market.huobi.huobi_api_order_book_data_source import HuobiAPIOrd
 
 
 class HuobiOrderBookTracker(OrderBookTracker):
+    __slots__ = (
+        "_ev_loop",
+        "_data_source",
+        "_trading_pairs",
+    )
     _hobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -36,8 +39,6 @@ class HuobiOrderBookTracker(OrderBookTracker):
                  data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API,
                  trading_pairs: Optional[List[str]] = None):
         super().__init__(data_source_type=data_source_type)
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[OrderBookTrackerDataSource] = None
         self._trading_pairs: Optional[List[str]] = trading_pairs
@@ -68,7 +69,7 @@ class HuobiOrderBookTracker(OrderBookTracker):
             self.data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_dispatcher)
         )
         self._refresh_tracking_task = safe_ensure_future(
             self._refresh_tracking_loop()
@@ -76,88 +77,27 @@ class HuobiOrderBookTracker(OrderBookTracker):
         self._order_book_diff_router_task = safe_ensure_future(
             self._order_book_diff_router()
         )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
 
-    async def _order_book_diff_router(self):
+    def _apply_pair_diffs(self,
+                          trading_pair: str,
+                          order_book: OrderBook,
+                          past_diffs_window: Deque,
+                          diff_messages: Iterable[OrderBookMessage]) -> int:
         """
-        Route the real-time order book diff messages to the correct order book.
+        Huobi websocket messages contain the entire order book state, so they're applied as snapshots through
+        _apply_snapshot() - only the newest message of the batch needs to be applied. They're kept out of the past
+        diffs window, as there's nothing to replay on top of a newer snapshot.
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
-        while True:
-            try:
-                ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
-                                        messages_accepted,
-                                        messages_rejected,
-                                        messages_queued)
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error routing order book messages.",
-                    exc_info=True,
-                    app_warning_msg=f"Unexpected error routing order book messages. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
-
-    async def _track_single_book(self, trading_pair: str):
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: OrderBook = self._order_books[trading_pair]
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
-
-        while True:
-            try:
-                message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    # Huobi websocket messages contain the entire order book state so they should be treated as snapshots
-                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error tracking order book for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg=f"Unexpected error tracking order book. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
+        snapshot_uid: int = order_book.snapshot_uid
+        newest_message: Optional[OrderBookMessage] = None
+        diffs_applied: int = 0
+        for message in diff_messages:
+            # Check the order book's initial update ID. If it's larger, don't bother.
+            if snapshot_uid > message.update_id:
+                continue
+            if newest_message is None or message.update_id >= newest_message.update_id:
+                newest_message = message
+            diffs_applied += 1
+        if newest_message is not None:
+            self._apply_snapshot(trading_pair, order_book, past_diffs_window, newest_message)
+        return diffs_applied
@@ -4,7 +4,7 @@ import logging
 from sqlalchemy.engine import RowProxy
 from typing import (
     Dict,
-    List,
+    Iterable,
     Optional
 )
 import ujson
@@ -66,5 +66,5 @@ cdef class IDEXOrderBook(OrderBook):
         raise NotImplementedError("IDEX order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("IDEX order book needs to retain individual order data.")
@@ -1,19 +1,11 @@
 #!/usr/bin/env python
 
 import asyncio
-import bisect
 import logging
-import time
-from collections import (
-    defaultdict,
-    deque,
-)
 from typing import (
-    Deque,
     Dict,
     List,
-    Optional,
-    Set
+    Optional
 )
 
 from hummingbot.core.event.events import TradeType
@@ -24,10 +16,8 @@ from hummingbot.core.data_type.order_book_tracker import (
 )
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.market.idex.idex_order_book import IDEXOrderBook
-from hummingbot.market.idex.idex_active_order_tracker import IDEXActiveOrderTracker
 from hummingbot.market.idex.idex_api_order_book_data_source import IDEXAPIOrderBookDataSource
 from hummingbot.market.idex.idex_order_book_message import IDEXOrderBookMessage
-from hummingbot.market.idex.idex_order_book_tracker_entry import IDEXOrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -36,6 +26,12 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
 class IDEXOrderBookTracker(OrderBookTracker):
+    __slots__ = (
+        "_idex_api_key",
+        "_ev_loop",
+        "_data_source",
+        "_trading_pairs",
+    )
     _iobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -50,14 +46,9 @@ class IDEXOrderBookTracker(OrderBookTracker):
                  trading_pairs: Optional[List[str]] = None):
         super().__init__(data_source_type=data_source_type)
         self._idex_api_key = idex_api_key
-        self._past_diffs_windows: Dict[str, Deque] = {}
         self._order_books: Dict[str, IDEXOrderBook] = {}
-        self._saved_message_queues: Dict[str, Deque[IDEXOrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[OrderBookTrackerDataSource] = None
-        self._active_order_trackers: Dict[str, IDEXActiveOrderTracker] = defaultdict(IDEXActiveOrderTracker)
         self._trading_pairs: Optional[List[str]] = trading_pairs
 
     @property
@@ -79,7 +70,7 @@ class IDEXOrderBookTracker(OrderBookTracker):
             self.data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self.data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_dispatcher)
         )
         self._refresh_tracking_task = safe_ensure_future(
             self._refresh_tracking_loop()
@@ -87,64 +78,18 @@ class IDEXOrderBookTracker(OrderBookTracker):
         self._order_book_diff_router_task = safe_ensure_future(
             self._order_book_diff_router()
         )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
-
-    async def _refresh_tracking_tasks(self):
-        """
-        Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
-        """
-        tracking_trading_pairs: Set[str] = set([key for key in self._tracking_tasks.keys()
-                                                if not self._tracking_tasks[key].done()])
-        available_pairs: Dict[str, IDEXOrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
-        available_trading_pairs: Set[str] = set(available_pairs.keys())
-        new_trading_pairs: Set[str] = available_trading_pairs - tracking_trading_pairs
-        deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
-
-        for trading_pair in new_trading_pairs:
-            order_book_tracker_entry: IDEXOrderBookTrackerEntry = available_pairs[trading_pair]
-            self._active_order_trackers[trading_pair] = order_book_tracker_entry.active_order_tracker
-            self._order_books[trading_pair] = order_book_tracker_entry.order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info("Started order book tracking for %s.", trading_pair)
-
-        for trading_pair in deleted_trading_pairs:
-            self._tracking_tasks[trading_pair].cancel()
-            del self._tracking_tasks[trading_pair]
-            del self._order_books[trading_pair]
-            del self._active_order_trackers[trading_pair]
-            del self._tracking_message_queues[trading_pair]
-            self.logger().info("Stopped order book tracking for %s.", trading_pair)
 
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
         while True:
             try:
                 ob_message: IDEXOrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: IDEXOrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
+                if self._route_pair_diffs(trading_pair, (ob_message,)) == 0:
                     continue
-                await message_queue.put(ob_message)
 
                 if ob_message.content["event"] == "market_trades":  # put trade messages to trade queue
                     trade_type = float(TradeType.BUY.value) if ob_message.content["type"].upper() == "BUY" \
@@ -157,21 +102,6 @@ class IDEXOrderBookTracker(OrderBookTracker):
                         "price": ob_message.content["price"],
                         "amount": ob_message.content["amount"]
                     }, timestamp=ob_message.timestamp))
-
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
-                                        messages_accepted,
-                                        messages_rejected,
-                                        messages_queued)
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -182,59 +112,8 @@ class IDEXOrderBookTracker(OrderBookTracker):
                 )
                 await asyncio.sleep(5.0)
 
-    async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[IDEXOrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: IDEXOrderBook = self._order_books[trading_pair]
-        active_order_tracker: IDEXActiveOrderTracker = self._active_order_trackers[trading_pair]
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
+    def _convert_diff_message(self, trading_pair: str, ob_message: IDEXOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_diff_message_to_order_book_row(ob_message)
 
-        while True:
-            try:
-                message: IDEXOrderBookMessage = None
-                saved_messages: Deque[IDEXOrderBookMessage] = self._saved_message_queues[trading_pair]
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                    # pass
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[IDEXOrderBookMessage] = list(past_diffs_window)
-                    # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
-                    replay_position = bisect.bisect_right(past_diffs, message)
-                    replay_diffs = past_diffs[replay_position:]
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
-                    for diff_message in replay_diffs:
-                        d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(diff_message)
-                        order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
-
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error tracking order book for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg=f"Unexpected error tracking order book. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
+    def _convert_snapshot_message(self, trading_pair: str, ob_message: IDEXOrderBookMessage):
+        return self._active_order_trackers[trading_pair].convert_snapshot_message_to_order_book_row(ob_message)
@@ -12,7 +12,6 @@ from typing import (
     List,
     Optional
 )
-import re
 import time
 import ujson
 import websockets
@@ -27,7 +26,6 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.kucoin.kucoin_order_book import KucoinOrderBook
 
-TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 SNAPSHOT_REST_URL = "https://api.kucoin.com/api/v2/market/orderbook/level2"
 DIFF_STREAM_URL = ""
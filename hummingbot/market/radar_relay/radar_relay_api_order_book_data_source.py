@@ -11,7 +11,6 @@ from typing import (
     List,
     Optional,
 )
-import re
 import time
 import ujson
 import websockets
@@ -29,7 +28,6 @@ from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerE
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 
-TRADING_PAIR_FILTER = re.compile(r"(WETH|DAI)$")
 
 REST_BASE_URL = "https://api.radarrelay.com/v2"
 TOKENS_URL = f"{REST_BASE_URL}/tokens"
@@ -4,7 +4,7 @@ import ujson
 import logging
 from typing import (
     Dict,
-    List,
+    Iterable,
     Optional,
 )
 
@@ -66,5 +66,5 @@ cdef class RadarRelayOrderBook(OrderBook):
         raise NotImplementedError("RadarRelay order book needs to retain individual order data.")
 
     @classmethod
-    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
+    def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: Iterable[OrderBookMessage]):
         raise NotImplementedError("RadarRelay order book needs to retain individual order data.")
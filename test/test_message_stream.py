@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import unittest
+from hummingbot.core.utils.message_stream import (
+    MessageDispatcher,
+    MessageStream,
+)
+
+
+class MessageStreamUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def test_get_in_order(self):
+        stream: MessageStream = MessageStream()
+        for i in range(3):
+            stream.put_nowait(i)
+        self.assertEqual(3, stream.qsize())
+        results = [self.ev_loop.run_until_complete(stream.get()) for _ in range(3)]
+        self.assertEqual([0, 1, 2], results)
+        self.assertTrue(stream.empty())
+
+    def test_wait_for_burst(self):
+        stream: MessageStream = MessageStream()
+
+        async def producer():
+            await asyncio.sleep(0.01)
+            for i in range(5):
+                stream.put_nowait(i)
+
+        async def consumer():
+            # The whole burst is pending once the first get() returns.
+            messages = [await stream.get()]
+            while not stream.empty():
+                messages.append(stream.get_nowait())
+            return messages
+
+        results, _ = self.ev_loop.run_until_complete(asyncio.gather(consumer(), producer()))
+        self.assertEqual([0, 1, 2, 3, 4], results)
+
+    def test_get_nowait(self):
+        stream: MessageStream = MessageStream()
+        stream.put_nowait(1)
+        self.assertEqual(1, stream.get_nowait())
+        with self.assertRaises(asyncio.QueueEmpty):
+            stream.get_nowait()
+
+    def test_keep_all_messages(self):
+        stream: MessageStream = MessageStream()
+        for i in range(200000):
+            stream.put_nowait(i)
+        self.assertEqual(200000, stream.qsize())
+        self.assertEqual(0, stream.get_nowait())
+
+    def test_dispatcher(self):
+        handled = []
+        dispatcher: MessageDispatcher = MessageDispatcher(handled.append)
+        for i in range(3):
+            dispatcher.put_nowait(i)
+        self.assertEqual([0, 1, 2], handled)
+
+
+if __name__ == "__main__":
+    unittest.main()
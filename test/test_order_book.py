@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from typing import (
+    List,
+    Tuple,
+)
+import numpy as np
+import unittest
+from unittest.mock import patch
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+class OrderBookUnitTest(unittest.TestCase):
+    @staticmethod
+    def make_order_book() -> OrderBook:
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(10.0, 1.0, 1), OrderBookRow(9.0, 1.0, 1)],
+            [OrderBookRow(11.0, 1.0, 1), OrderBookRow(12.0, 1.0, 1)],
+            1
+        )
+        return order_book
+
+    @staticmethod
+    def make_diffs() -> List[Tuple[List[OrderBookRow], List[OrderBookRow], int]]:
+        return [
+            ([OrderBookRow(10.0, 2.0, 2)], [OrderBookRow(11.0, 0.0, 2)], 2),
+            ([OrderBookRow(10.0, 3.0, 3), OrderBookRow(10.5, 1.0, 3)], [], 3),
+            # Crosses the 10.5 bid from the previous diff - the newer ask wins.
+            ([], [OrderBookRow(10.5, 2.0, 4)], 4),
+        ]
+
+    def test_apply_diffs_batch(self):
+        diffs = self.make_diffs()
+        sequential_order_book: OrderBook = self.make_order_book()
+        for bids, asks, update_id in diffs:
+            sequential_order_book.apply_diffs(bids, asks, update_id)
+
+        batch_order_book: OrderBook = self.make_order_book()
+        batch_order_book.apply_diffs_batch([bids for bids, _, _ in diffs],
+                                           [asks for _, asks, _ in diffs],
+                                           [update_id for _, _, update_id in diffs])
+
+        self.assertEqual([OrderBookRow(10.0, 3.0, 3), OrderBookRow(9.0, 1.0, 1)],
+                         list(batch_order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(10.5, 2.0, 4), OrderBookRow(12.0, 1.0, 1)],
+                         list(batch_order_book.ask_entries()))
+        self.assertEqual(list(sequential_order_book.bid_entries()), list(batch_order_book.bid_entries()))
+        self.assertEqual(list(sequential_order_book.ask_entries()), list(batch_order_book.ask_entries()))
+        self.assertEqual(4, batch_order_book.last_diff_uid)
+        self.assertEqual(10.0, batch_order_book.get_price(False))
+        self.assertEqual(10.5, batch_order_book.get_price(True))
+
+    def test_apply_crossing_diffs_batch(self):
+        # The first diff crosses the 100 ask, which gets truncated away - even though the next diff removes the bid
+        # that crossed it.
+        diffs = [
+            ([OrderBookRow(101.0, 1.0, 2)], [], 2),
+            ([OrderBookRow(101.0, 0.0, 3)], [], 3),
+        ]
+        sequential_order_book: OrderBook = OrderBook()
+        sequential_order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(100.0, 1.0, 1)], 1)
+        for bids, asks, update_id in diffs:
+            sequential_order_book.apply_diffs(bids, asks, update_id)
+
+        batch_order_book: OrderBook = OrderBook()
+        batch_order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(100.0, 1.0, 1)], 1)
+        batch_order_book.apply_diffs_batch([bids for bids, _, _ in diffs],
+                                           [asks for _, asks, _ in diffs],
+                                           [update_id for _, _, update_id in diffs])
+
+        self.assertEqual([OrderBookRow(99.0, 1.0, 1)], list(batch_order_book.bid_entries()))
+        self.assertEqual([], list(batch_order_book.ask_entries()))
+        self.assertEqual(list(sequential_order_book.bid_entries()), list(batch_order_book.bid_entries()))
+        self.assertEqual(list(sequential_order_book.ask_entries()), list(batch_order_book.ask_entries()))
+        self.assertEqual(3, batch_order_book.last_diff_uid)
+
+    def test_apply_empty_diffs_batch(self):
+        order_book: OrderBook = self.make_order_book()
+        order_book.apply_diffs_batch([], [], [])
+        self.assertEqual([OrderBookRow(10.0, 1.0, 1), OrderBookRow(9.0, 1.0, 1)], list(order_book.bid_entries()))
+        self.assertEqual(0, order_book.last_diff_uid)
+
+    def test_apply_diffs_from_generators(self):
+        order_book: OrderBook = self.make_order_book()
+        order_book.apply_diffs((row for row in [OrderBookRow(10.0, 2.0, 2)]),
+                               (row for row in [OrderBookRow(11.0, 0.0, 2)]),
+                               2)
+        self.assertEqual([OrderBookRow(10.0, 2.0, 2), OrderBookRow(9.0, 1.0, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(12.0, 1.0, 1)], list(order_book.ask_entries()))
+
+    def test_apply_numpy_rows(self):
+        bids: List[List[float]] = [[10.0, 1.0, 1], [9.0, 2.0, 2]]
+        asks: List[List[float]] = [[11.0, 1.0, 3], [12.0, 2.0, 1]]
+        float_bids: np.ndarray = np.array(bids, dtype="float64")
+        float_asks: np.ndarray = np.array(asks, dtype="float64")
+        # Every other column of a wider array, which isn't contiguous in memory.
+        strided_bids: np.ndarray = np.repeat(float_bids, 2, axis=1)[:, ::2]
+        strided_asks: np.ndarray = np.repeat(float_asks, 2, axis=1)[:, ::2]
+        self.assertFalse(strided_bids.flags["C_CONTIGUOUS"])
+        inputs = [
+            (float_bids, float_asks),
+            (strided_bids, strided_asks),
+            (float_bids.astype("int64"), float_asks.astype("float32")),
+            (bids, asks),
+            ([OrderBookRow(*row) for row in bids], [OrderBookRow(*row) for row in asks]),
+        ]
+
+        for bids_input, asks_input in inputs:
+            snapshot_order_book: OrderBook = OrderBook()
+            snapshot_order_book.apply_numpy_snapshot(bids_input, asks_input)
+            self.assertEqual([OrderBookRow(10.0, 1.0, 1), OrderBookRow(9.0, 2.0, 2)],
+                             list(snapshot_order_book.bid_entries()))
+            self.assertEqual([OrderBookRow(11.0, 1.0, 3), OrderBookRow(12.0, 2.0, 1)],
+                             list(snapshot_order_book.ask_entries()))
+            self.assertEqual(3, snapshot_order_book.snapshot_uid)
+
+            diffs_order_book: OrderBook = OrderBook()
+            diffs_order_book.apply_numpy_diffs(bids_input, asks_input)
+            self.assertEqual(list(snapshot_order_book.bid_entries()), list(diffs_order_book.bid_entries()))
+            self.assertEqual(list(snapshot_order_book.ask_entries()), list(diffs_order_book.ask_entries()))
+            self.assertEqual(3, diffs_order_book.last_diff_uid)
+
+        empty_order_book: OrderBook = OrderBook()
+        empty_order_book.apply_numpy_diffs([], np.empty((0, 3)))
+        self.assertEqual([], list(empty_order_book.bid_entries()))
+
+        # Rows without all 3 columns are rejected before they're indexed.
+        order_book: OrderBook = self.make_order_book()
+        for bad_input in [float_bids[:, :2], float_bids[0], float_bids.reshape((2, 3, 1))]:
+            with self.assertRaises(ValueError):
+                order_book.apply_numpy_diffs(bad_input, float_asks)
+            with self.assertRaises(ValueError):
+                order_book.apply_numpy_snapshot(float_bids, bad_input)
+        self.assertEqual([OrderBookRow(10.0, 1.0, 1), OrderBookRow(9.0, 1.0, 1)], list(order_book.bid_entries()))
+
+    def test_apply_trade_raw(self):
+        order_book: OrderBook = self.make_order_book()
+        with patch("hummingbot.core.data_type.order_book.OrderBookTradeEvent", wraps=OrderBookTradeEvent) as event_class:
+            # No trade event listener yet - the trade event isn't even built.
+            order_book.apply_trade_raw("ETH-USDT", 1.0, 10.0, 1.0, float(TradeType.BUY.value))
+            self.assertEqual(0, event_class.call_count)
+
+            event_logger: EventLogger = EventLogger()
+            order_book.add_listener(OrderBookEvent.TradeEvent, event_logger)
+            order_book.apply_trade_raw("ETH-USDT", 2.0, 10.0, 2.0, float(TradeType.BUY.value))
+            order_book.apply_trade_raw("ETH-USDT", 3.0, 11.0, 3.0, float(TradeType.SELL.value))
+            self.assertEqual(2, event_class.call_count)
+            trade_events: List[OrderBookTradeEvent] = event_logger.event_log
+            self.assertEqual(2, len(trade_events))
+            self.assertEqual(TradeType.BUY, trade_events[0].type)
+            self.assertEqual(("ETH-USDT", 2.0, 10.0, 2.0),
+                             (trade_events[0].trading_pair, trade_events[0].timestamp, trade_events[0].price,
+                              trade_events[0].amount))
+            self.assertEqual(TradeType.SELL, trade_events[1].type)
+
+            order_book.remove_listener(OrderBookEvent.TradeEvent, event_logger)
+            order_book.apply_trade_raw("ETH-USDT", 4.0, 10.0, 1.0, float(TradeType.BUY.value))
+            self.assertEqual(2, len(event_logger.event_log))
+            self.assertEqual(2, event_class.call_count)
+
+    def test_snapshot_cache(self):
+        order_book: OrderBook = self.make_order_book()
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([10.0, 9.0], list(bids_df.price))
+        self.assertEqual([11.0, 12.0], list(asks_df.price))
+
+        # The returned data frames are copies, so modifying them doesn't affect later reads.
+        bids_df.loc[0, "amount"] = 100.0
+        asks_df.drop(asks_df.index, inplace=True)
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([1.0, 1.0], list(bids_df.amount))
+        self.assertEqual([11.0, 12.0], list(asks_df.price))
+
+        order_book.apply_diffs([OrderBookRow(10.0, 2.0, 2)], [OrderBookRow(11.0, 0.0, 2)], 2)
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([2.0, 1.0], list(bids_df.amount))
+        self.assertEqual([12.0], list(asks_df.price))
+
+        order_book.apply_diffs_batch([[OrderBookRow(9.0, 0.0, 3)]], [[]], [3])
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([10.0], list(bids_df.price))
+
+        order_book.apply_snapshot([OrderBookRow(8.0, 1.0, 4)], [OrderBookRow(13.0, 1.0, 4)], 4)
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([8.0], list(bids_df.price))
+        self.assertEqual([13.0], list(asks_df.price))
+
+    def test_composite_snapshot_cache(self):
+        order_book: CompositeOrderBook = CompositeOrderBook()
+        order_book.apply_snapshot([OrderBookRow(10.0, 1.0, 1)], [OrderBookRow(11.0, 1.0, 1)], 1)
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([1.0], list(asks_df.amount))
+
+        order_book.record_filled_order(OrderFilledEvent(2.0, "buy-1", "ETH-USDT", TradeType.BUY, OrderType.LIMIT,
+                                                        11.0, 0.4, TradeFee(0.0)))
+        bids_df, asks_df = order_book.snapshot
+        self.assertAlmostEqual(0.6, asks_df.amount[0])
+
+        order_book.clear_traded_order_book()
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([1.0], list(asks_df.amount))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Tuple,
+)
+import unittest
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.event.events import TradeType
+
+
+class RecordingOrderBook:
+    def __init__(self):
+        self.trades: List[Tuple[str, float, float, float, float]] = []
+
+    def apply_trade_raw(self, trading_pair: str, timestamp: float, price: float, amount: float, trade_type: float):
+        self.trades.append((trading_pair, timestamp, price, amount, trade_type))
+
+
+class FailingOrderBook:
+    snapshot_uid: int = 0
+
+    def apply_diffs_batch(self, bids_batch, asks_batch, update_ids):
+        raise ValueError("Invalid order book diffs.")
+
+
+class QueueStreamOrderBookTracker(OrderBookTracker):
+    def __init__(self):
+        super().__init__()
+        # The base loops only use the get(), get_nowait(), empty() and put_nowait() calls that MessageStream shares
+        # with asyncio.Queue, so exchange trackers may replace the base message streams with plain queues.
+        self._order_book_trade_stream = asyncio.Queue()
+
+    @property
+    def data_source(self):
+        return None
+
+
+class MockDataSource:
+    def __init__(self):
+        self.tracking_pairs: Dict[str, OrderBookTrackerEntry] = {}
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        return self.tracking_pairs
+
+
+class InlineOrderBookTracker(OrderBookTracker):
+    __slots__ = (
+        "_data_source",
+    )
+
+    def __init__(self):
+        super().__init__()
+        self._data_source: MockDataSource = MockDataSource()
+
+    @property
+    def data_source(self) -> MockDataSource:
+        return self._data_source
+
+
+class ConvertingOrderBookTracker(InlineOrderBookTracker):
+    """
+    Stands in for the exchange trackers that convert the order book messages through an active order tracker.
+    """
+    __slots__ = (
+        "converted_messages",
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.converted_messages: List[Tuple[str, int]] = []
+
+    def _convert_diff_message(self, trading_pair, ob_message):
+        self.converted_messages.append((trading_pair, ob_message.update_id))
+        return ob_message.bids, ob_message.asks
+
+    def _convert_snapshot_message(self, trading_pair, ob_message):
+        self.converted_messages.append((trading_pair, ob_message.update_id))
+        return ob_message.bids, ob_message.asks
+
+
+class ActiveOrderTrackerEntry(OrderBookTrackerEntry):
+    def __init__(self, trading_pair: str, timestamp: float, order_book: OrderBook, active_order_tracker: object):
+        super().__init__(trading_pair, timestamp, order_book)
+        self._active_order_tracker = active_order_tracker
+
+    @property
+    def active_order_tracker(self) -> object:
+        return self._active_order_tracker
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    @staticmethod
+    def make_trade(trading_pair: str, timestamp: float, trade_type: TradeType) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair,
+            "trade_type": float(trade_type.value),
+            "trade_id": int(timestamp),
+            "price": "10.0",
+            "amount": "2.0",
+        }, timestamp=timestamp)
+
+    @staticmethod
+    def make_diff(trading_pair: str, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": [["10.0", str(float(update_id))]],
+            "asks": [],
+        }, timestamp=float(update_id))
+
+    def test_inline_diff_routing(self):
+        tracker: InlineOrderBookTracker = InlineOrderBookTracker()
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10.0, 1.0, 5)], [OrderBookRow(11.0, 1.0, 5)], 5)
+
+        async def run_router():
+            task: asyncio.Task = self.ev_loop.create_task(tracker._order_book_diff_router())
+            # Diffs of a pair that isn't tracked yet are saved, and the ones newer than its snapshot are applied once
+            # tracking starts.
+            for update_id in range(3, 8):
+                tracker._order_book_diff_stream.put_nowait(self.make_diff("ETH-USDT", update_id))
+            await asyncio.sleep(0.01)
+            self.assertEqual(5, tracker._stats["diff_messages_queued"])
+            tracker.data_source.tracking_pairs = {"ETH-USDT": OrderBookTrackerEntry("ETH-USDT", 0.0, order_book)}
+            await tracker._refresh_tracking_tasks()
+            self.assertEqual(7, order_book.last_diff_uid)
+            self.assertEqual([OrderBookRow(10.0, 7.0, 7)], list(order_book.bid_entries()))
+
+            for update_id in range(8, 10):
+                tracker._order_book_diff_stream.put_nowait(self.make_diff("ETH-USDT", update_id))
+            await asyncio.sleep(0.01)
+            self.assertFalse(task.done())
+            task.cancel()
+
+        self.ev_loop.run_until_complete(run_router())
+        self.assertEqual(9, order_book.last_diff_uid)
+        self.assertEqual([OrderBookRow(10.0, 9.0, 9)], list(order_book.bid_entries()))
+        self.assertEqual([5, 6, 7, 8, 9], [message.update_id for message in tracker._pair_states["ETH-USDT"][1]])
+
+    def test_diff_router_skips_malformed_messages(self):
+        tracker: InlineOrderBookTracker = InlineOrderBookTracker()
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10.0, 1.0, 1)], [OrderBookRow(11.0, 1.0, 1)], 1)
+        tracker.data_source.tracking_pairs = {"ETH-USDT": OrderBookTrackerEntry("ETH-USDT", 0.0, order_book)}
+
+        async def run_router():
+            await tracker._refresh_tracking_tasks()
+            task: asyncio.Task = self.ev_loop.create_task(tracker._order_book_diff_router())
+            # A message without a trading pair in the middle of a batch doesn't drop the diffs around it.
+            tracker._order_book_diff_stream.put_nowait(self.make_diff("ETH-USDT", 2))
+            tracker._order_book_diff_stream.put_nowait(None)
+            tracker._order_book_diff_stream.put_nowait(self.make_diff("ETH-USDT", 3))
+            await asyncio.sleep(0.01)
+            self.assertFalse(task.done())
+            task.cancel()
+
+        self.ev_loop.run_until_complete(run_router())
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(2, tracker._stats["diff_messages_accepted"])
+        self.assertEqual(1, tracker._stats["diff_messages_rejected"])
+
+    def test_route_pair_diffs(self):
+        tracker: InlineOrderBookTracker = InlineOrderBookTracker()
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10.0, 1.0, 2)], [OrderBookRow(11.0, 1.0, 2)], 2)
+
+        # Diffs of a pair that isn't tracked yet are saved.
+        self.assertEqual(0, tracker._route_pair_diffs("ETH-USDT", [self.make_diff("ETH-USDT", 3)]))
+        self.assertEqual(1, tracker._stats["diff_messages_queued"])
+        tracker.data_source.tracking_pairs = {"ETH-USDT": OrderBookTrackerEntry("ETH-USDT", 0.0, order_book)}
+        self.ev_loop.run_until_complete(tracker._refresh_tracking_tasks())
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(1, tracker._stats["diff_messages_accepted"])
+
+        # Diffs older than the snapshot are rejected.
+        self.assertEqual(1, tracker._route_pair_diffs("ETH-USDT", [self.make_diff("ETH-USDT", 1),
+                                                                   self.make_diff("ETH-USDT", 4)]))
+        self.assertEqual(2, tracker._stats["diff_messages_accepted"])
+        self.assertEqual(1, tracker._stats["diff_messages_rejected"])
+
+        # Diffs that fail to apply are rejected, without raising.
+        tracker._pair_states["BTC-USDT"] = (FailingOrderBook(), deque())
+        self.assertEqual(0, tracker._route_pair_diffs("BTC-USDT", [self.make_diff("BTC-USDT", 1)]))
+        self.assertEqual(2, tracker._stats["diff_messages_accepted"])
+        self.assertEqual(2, tracker._stats["diff_messages_rejected"])
+
+        # Diffs of a pair that is no longer tracked are rejected, rather than saved.
+        tracker.data_source.tracking_pairs = {}
+        del tracker._pair_states["BTC-USDT"]
+        self.ev_loop.run_until_complete(tracker._refresh_tracking_tasks())
+        self.assertEqual(0, tracker._route_pair_diffs("ETH-USDT", [self.make_diff("ETH-USDT", 5)]))
+        self.assertEqual(3, tracker._stats["diff_messages_rejected"])
+        self.assertNotIn("ETH-USDT", tracker._saved_message_queues)
+
+    def test_failed_saved_diffs(self):
+        tracker: InlineOrderBookTracker = InlineOrderBookTracker()
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10.0, 1.0, 1)], [OrderBookRow(11.0, 1.0, 1)], 1)
+        tracker._route_pair_diffs("BTC-USDT", [self.make_diff("BTC-USDT", 2)])
+        tracker._route_pair_diffs("ETH-USDT", [self.make_diff("ETH-USDT", 2)])
+        tracker.data_source.tracking_pairs = {
+            "BTC-USDT": OrderBookTrackerEntry("BTC-USDT", 0.0, FailingOrderBook()),
+            "ETH-USDT": OrderBookTrackerEntry("ETH-USDT", 0.0, order_book),
+        }
+
+        # Saved diffs that fail to apply are rejected, without holding up the other new pairs.
+        self.ev_loop.run_until_complete(tracker._refresh_tracking_tasks())
+        self.assertEqual({"BTC-USDT", "ETH-USDT"}, set(tracker._pair_states.keys()))
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual(1, tracker._stats["diff_messages_accepted"])
+        self.assertEqual(1, tracker._stats["diff_messages_rejected"])
+
+    def test_failed_diffs_not_in_past_diffs_window(self):
+        tracker: InlineOrderBookTracker = InlineOrderBookTracker()
+        past_diffs_window: Deque = deque(maxlen=tracker.PAST_DIFF_WINDOW_SIZE)
+        with self.assertRaises(ValueError):
+            tracker._apply_pair_diffs("ETH-USDT", FailingOrderBook(), past_diffs_window,
+                                      [self.make_diff("ETH-USDT", 1), self.make_diff("ETH-USDT", 2)])
+        # Diffs that never made it into the order book must not be replayed on the next snapshot.
+        self.assertEqual(0, len(past_diffs_window))
+
+    def test_handle_snapshot(self):
+        tracker: InlineOrderBookTracker = InlineOrderBookTracker()
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10.0, 1.0, 1)], [OrderBookRow(11.0, 1.0, 1)], 1)
+        tracker.data_source.tracking_pairs = {"ETH-USDT": OrderBookTrackerEntry("ETH-USDT", 0.0, order_book)}
+        self.ev_loop.run_until_complete(tracker._refresh_tracking_tasks())
+        past_diffs_window = tracker._pair_states["ETH-USDT"][1]
+        for update_id in range(2, 5):
+            past_diffs_window.append(self.make_diff("ETH-USDT", update_id))
+
+        # Malformed snapshots are logged, and don't raise into the snapshot listener.
+        tracker._order_book_snapshot_dispatcher.put_nowait(None)
+        # Snapshots of untracked pairs are ignored.
+        tracker._order_book_snapshot_dispatcher.put_nowait(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "BTC-USDT",
+            "update_id": 3,
+            "bids": [],
+            "asks": [],
+        }, timestamp=3.0))
+        # The snapshot is applied as soon as it's dispatched, and the newer past diffs are replayed on top of it.
+        tracker._order_book_snapshot_dispatcher.put_nowait(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "ETH-USDT",
+            "update_id": 3,
+            "bids": [["9.0", "1.0"]],
+            "asks": [["11.0", "3.0"]],
+        }, timestamp=3.0))
+        self.assertEqual(3, order_book.snapshot_uid)
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual([OrderBookRow(10.0, 4.0, 4), OrderBookRow(9.0, 1.0, 3)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11.0, 3.0, 3)], list(order_book.ask_entries()))
+
+    def test_convert_hooks(self):
+        tracker: ConvertingOrderBookTracker = ConvertingOrderBookTracker()
+        order_book: OrderBook = OrderBook()
+        active_order_tracker: object = object()
+        # Diffs saved before tracking starts go through the same hook as the routed ones.
+        tracker._saved_message_queues["ETH-USDT"].extend([self.make_diff("ETH-USDT", 1),
+                                                          self.make_diff("ETH-USDT", 3)])
+        tracker.data_source.tracking_pairs = {
+            "ETH-USDT": ActiveOrderTrackerEntry("ETH-USDT", 0.0, order_book, active_order_tracker)
+        }
+        self.ev_loop.run_until_complete(tracker._refresh_tracking_tasks())
+        self.assertEqual([("ETH-USDT", 1), ("ETH-USDT", 3)], tracker.converted_messages)
+        self.assertIs(active_order_tracker, tracker._active_order_trackers["ETH-USDT"])
+
+        # The snapshot is converted before the newer past diffs, which are converted again as they're replayed.
+        tracker._order_book_snapshot_dispatcher.put_nowait(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "ETH-USDT",
+            "update_id": 2,
+            "bids": [],
+            "asks": [],
+        }, timestamp=2.0))
+        self.assertEqual([("ETH-USDT", 1), ("ETH-USDT", 3), ("ETH-USDT", 2), ("ETH-USDT", 3)],
+                         tracker.converted_messages)
+        self.assertEqual([OrderBookRow(10.0, 3.0, 3)], list(order_book.bid_entries()))
+
+        tracker.data_source.tracking_pairs = {}
+        self.ev_loop.run_until_complete(tracker._refresh_tracking_tasks())
+        self.assertEqual({}, tracker.order_books)
+        self.assertEqual({}, tracker._pair_states)
+        self.assertEqual({}, tracker._active_order_trackers)
+
+    def test_slots(self):
+        tracker: InlineOrderBookTracker = InlineOrderBookTracker()
+        self.assertFalse(hasattr(tracker, "__dict__"))
+        with self.assertRaises(AttributeError):
+            tracker._undeclared_attribute = None
+
+    def test_emit_trade_event_loop_with_queue_stream(self):
+        tracker: QueueStreamOrderBookTracker = QueueStreamOrderBookTracker()
+        order_book: RecordingOrderBook = RecordingOrderBook()
+        tracker.order_books["ETH-USDT"] = order_book
+
+        async def run_loop():
+            task: asyncio.Task = self.ev_loop.create_task(tracker._emit_trade_event_loop())
+            tracker._order_book_trade_stream.put_nowait(self.make_trade("ETH-USDT", 1.0, TradeType.BUY))
+            tracker._order_book_trade_stream.put_nowait(self.make_trade("BTC-USDT", 2.0, TradeType.BUY))
+            # A malformed trade is rejected on its own, without the rest of the burst.
+            tracker._order_book_trade_stream.put_nowait(None)
+            tracker._order_book_trade_stream.put_nowait(self.make_trade("ETH-USDT", 3.0, TradeType.SELL))
+            await asyncio.sleep(0.05)
+            self.assertFalse(task.done())
+            task.cancel()
+
+        self.ev_loop.run_until_complete(run_loop())
+        self.assertEqual([
+            ("ETH-USDT", 1.0, 10.0, 2.0, float(TradeType.BUY.value)),
+            ("ETH-USDT", 3.0, 10.0, 2.0, float(TradeType.SELL.value)),
+        ], order_book.trades)
+        self.assertEqual(2, tracker._stats["trade_messages_accepted"])
+        self.assertEqual(2, tracker._stats["trade_messages_rejected"])
+
+
+if __name__ == "__main__":
+    unittest.main()